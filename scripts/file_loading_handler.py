@@ -1,5 +1,55 @@
 
-import pandas as pd
+import os
+from functools import lru_cache
+
+import numpy as np
+
+# Opt-in Modin backend: with USE_MODIN set in the environment, the same
+# pandas surface API runs partitioned across every core, which pays off on
+# CSVs big enough to keep single-core pandas busy for minutes
+USE_MODIN = bool(os.environ.get('USE_MODIN'))
+if USE_MODIN:
+    import modin.pandas as pd
+else:
+    import pandas as pd
+
+# pandas' pyarrow CSV engine parses with multiple threads; fall back to the
+# default C engine when pyarrow is not installed
+try:
+    import pyarrow.csv  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# dask is optional: it backs the out-of-core path (load_data(lazy=True)) for
+# datasets too large to hold in memory at once
+try:
+    import dask.dataframe as dd
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+# Sensor reading columns, all safely representable in float32; downcasting
+# halves the bytes every downstream scan has to move
+SENSOR_COLS = ['GHI', 'DNI', 'DHI', 'ModA', 'ModB', 'WS', 'WSgust', 'WD',
+               'Tamb', 'RH', 'TModA', 'TModB']
+
+# Low-cardinality flag columns: as 'category' a groupby uses the integer
+# code table directly instead of hashing every element
+CATEGORICAL_COLS = ['Cleaning']
+
+@lru_cache(maxsize=8)
+def _read_parquet_memo(path, mtime, columns):
+    """
+    In-process memo over sidecar reads: handlers created repeatedly for the
+    same file in one session (one per plot cell is common in the notebooks)
+    get the already-parsed frame back as a dict lookup. The mtime in the key
+    makes an updated file miss naturally; callers must take a shallow copy
+    so the cached frame itself is never mutated.
+    """
+    cols = list(columns) if columns is not None else None
+    return pd.read_parquet(path, columns=cols)
+
 
 class FileLoadingHandler:
     """
@@ -9,26 +59,164 @@ class FileLoadingHandler:
     def __init__(self, file_path):
         self.file_path = file_path
         self.df = None
-        
-    def load_data(self):
+
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        self._df = value
+        # Descriptive statistics cached by subclasses describe the current
+        # frame only, so rebinding the frame discards them; likewise the
+        # outlier flag column belongs to the frame that was scanned
+        self._stats = {}
+        self._outliers_flagged = False
+
+    def finite_mask(self, cols):
+        """
+        Boolean mask of rows where every column in cols is finite, cached
+        per column tuple so repeated plots over the same columns pay the
+        NaN scan once. The df setter clears the cache along with the other
+        per-frame statistics, so masks always describe the current frame.
+        """
+        key = ('finite', tuple(cols))
+        mask = self._stats.get(key)
+        if mask is None:
+            arr = self._df[list(cols)].to_numpy(dtype=np.float32)
+            mask = np.isfinite(arr).all(axis=1)
+            self._stats[key] = mask
+        return mask
+
+    def load_data(self, lazy=False, columns=None, chunksize=None, reduce_fn=None):
         """
         Load the dataset from the CSV file and convert 'Timestamp' to datetime if present.
-        
+
         This method is reused by both DatasetHandler and EDAHandler.
 
+        The parsed result is cached as a Parquet sidecar next to the CSV;
+        while the sidecar is newer than the CSV, later loads skip parsing
+        entirely and read the columnar file in tens of milliseconds.
+
+        Parameters:
+        -----------
+        lazy : bool, default False
+            When True (requires dask), return a lazily-evaluated Dask
+            DataFrame read in 64MB blocks; downstream reductions then
+            stream chunk-by-chunk, so the dataset never has to fit in RAM.
+        columns : list of str, optional
+            Subset of columns to load: a cache hit reads only those columns
+            from the Parquet sidecar, and a cache miss passes them to the
+            parser as usecols so the rest are never tokenized. The sidecar
+            only ever stores full frames.
+        chunksize : int, optional
+            Stream the CSV in row chunks of this size (C engine), keeping
+            peak parse memory at one chunk instead of 2-3x the file size.
+        reduce_fn : callable, optional
+            With chunksize set, applied to each chunk as it streams; only
+            the reduced pieces are kept and concatenated, so aggregation
+            workflows never hold the full rows in memory.
+
         Returns:
         --------
-        pd.DataFrame or None
+        pd.DataFrame, dd.DataFrame or None
             Loaded DataFrame or None if loading failed.
         """
         try:
-            self.df = pd.read_csv(self.file_path)
-            
-            # Convert 'Timestamp' to datetime objects
-            if 'Timestamp' in self.df.columns:
-                self.df['Timestamp'] = pd.to_datetime(self.df['Timestamp'])
+            if lazy:
+                if not DASK_AVAILABLE:
+                    print("!!! ERROR: lazy=True requires dask to be installed.")
+                    return None
+                # Peek at the header to know whether Timestamp parsing applies
+                header = pd.read_csv(self.file_path, nrows=0)
+                parse_dates = ['Timestamp'] if 'Timestamp' in header.columns else None
+                self.df = dd.read_csv(self.file_path, blocksize='64MB',
+                                      parse_dates=parse_dates)
+                return self.df
+
+            # Fresh sidecar: mmap the columnar file instead of re-parsing.
+            # Chunked/reduced loads bypass the hit — they exist to cap peak
+            # memory or keep only per-chunk reductions, and the sidecar
+            # would hand back the full materialized frame instead
+            cache = self.file_path + '.parquet'
+            if chunksize is None and reduce_fn is None and os.path.exists(cache) and \
+                    os.path.getmtime(cache) >= os.path.getmtime(self.file_path):
+                self.df = _read_parquet_memo(
+                    os.path.abspath(cache), os.path.getmtime(cache),
+                    tuple(columns) if columns is not None else None,
+                ).copy(deep=False)
+                # Parquet round-trips integer categoricals back to plain
+                # integers, so the flag conversion is re-applied here
+                for col in CATEGORICAL_COLS:
+                    if col in self.df.columns:
+                        self.df[col] = self.df[col].astype('category')
+                return self.df
+
+            # Peek at the header so the dtype schema and date parsing can be
+            # handed to the parser itself: sensor columns then materialize
+            # as float32 directly and Timestamp arrives as datetime64,
+            # instead of each needing a second full-column pass afterwards
+            header = pd.read_csv(self.file_path, nrows=0)
+
+            # Push a requested projection into the parser as usecols, so
+            # unused columns are never even tokenized; a partial frame must
+            # not become the sidecar, so caching is skipped in that case
+            usecols = None
+            wanted = list(header.columns)
+            if columns is not None:
+                usecols = [c for c in header.columns if c in columns]
+                wanted = usecols
+
+            dtypes = {c: 'float32' for c in SENSOR_COLS if c in wanted}
+            parse_dates = ['Timestamp'] if 'Timestamp' in wanted else None
+
+            if chunksize is not None:
+                # Stream row chunks through the C engine (pyarrow's reader
+                # has no chunked mode); with a reduce_fn only the reduced
+                # pieces survive, otherwise the chunks are concatenated once
+                reader = pd.read_csv(self.file_path, engine='c',
+                                     chunksize=chunksize, dtype=dtypes,
+                                     parse_dates=parse_dates, usecols=usecols)
+                if reduce_fn is not None:
+                    pieces = [reduce_fn(chunk) for chunk in reader]
+                else:
+                    pieces = list(reader)
+                self.df = pd.concat(pieces, ignore_index=True, copy=False)
+            elif CSV_ENGINE == 'pyarrow':
+                # Multi-threaded parse when pyarrow is available
+                self.df = pd.read_csv(self.file_path, engine='pyarrow',
+                                      dtype=dtypes, parse_dates=parse_dates,
+                                      usecols=usecols)
+            else:
+                # C-engine fallback: mmap the file straight into the
+                # tokenizer and skip the low-memory chunked dtype
+                # re-inference pass
+                self.df = pd.read_csv(self.file_path, engine='c',
+                                      memory_map=True, low_memory=False,
+                                      dtype=dtypes, parse_dates=parse_dates,
+                                      usecols=usecols)
+
+            # Store low-cardinality flags as categoricals
+            for col in CATEGORICAL_COLS:
+                if col in self.df.columns:
+                    self.df[col] = self.df[col].astype('category')
+
+            if parse_dates and 'Timestamp' in self.df.columns:
+                # parse_dates leaves unparseable columns as object; fall
+                # back to pandas' format inference for those
+                if not pd.api.types.is_datetime64_any_dtype(self.df['Timestamp']):
+                    self.df['Timestamp'] = pd.to_datetime(self.df['Timestamp'])
                 print("✅ 'Timestamp' column successfully converted to datetime objects.")
-            
+
+            # Best-effort: persist the parsed frame so the next load can
+            # skip the CSV entirely (read-only data dirs just stay uncached);
+            # reduced frames are not the file's contents, so they never cache
+            if columns is None and reduce_fn is None:
+                try:
+                    self.df.to_parquet(cache, index=False, compression='zstd')
+                except Exception:
+                    pass
+
             return self.df
         except FileNotFoundError:
             print(f"!!! ERROR: The file '{self.file_path}' was not found.")